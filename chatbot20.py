@@ -2,39 +2,183 @@ import tkinter as tk
 from tkinter import ttk, scrolledtext, filedialog
 import threading
 import time
+import queue
 from datetime import datetime
 import os
 import json
+import re
+from collections import deque
 import numpy as np
 
 # IMPORTANT: Before running this code, install required dependencies:
 # pip install pillow opencv-python mediapipe pyttsx3
 
-# Optional try/except block to handle missing dependencies
-try:
-    import cv2
-    from PIL import Image, ImageTk
-    import mediapipe as mp
-    CAMERA_AVAILABLE = True
-    MEDIAPIPE_AVAILABLE = True
-except ImportError as e:
-    CAMERA_AVAILABLE = False
-    MEDIAPIPE_AVAILABLE = False
-    missing_lib = str(e).split("'")[1] if "'" in str(e) else str(e)
-    print(f"Missing dependency: {missing_lib}")
+import importlib.util
+
+# The heavy optional dependencies (tens of MB of resident memory and a
+# second or more of import time for mediapipe alone) are only imported
+# the first time a feature that needs them is turned on. Availability is
+# probed cheaply here so the UI can still explain what's missing.
+CAMERA_AVAILABLE = (importlib.util.find_spec("cv2") is not None
+                    and importlib.util.find_spec("PIL") is not None)
+MEDIAPIPE_AVAILABLE = CAMERA_AVAILABLE and importlib.util.find_spec("mediapipe") is not None
+
+if not CAMERA_AVAILABLE or not MEDIAPIPE_AVAILABLE:
     print("Please install required packages:")
     print("pip install opencv-python pillow mediapipe")
 
-# Try to import text-to-speech engine
-try:
-    import pyttsx3
-    TTS_AVAILABLE = True
-except ImportError:
-    TTS_AVAILABLE = False
+TTS_AVAILABLE = importlib.util.find_spec("pyttsx3") is not None
+
+if not TTS_AVAILABLE:
     print("Text-to-speech not available. Install pyttsx3:")
     print("pip install pyttsx3")
 
+# Filled in by the _ensure_* loaders on first use
+cv2 = None
+Image = None
+ImageTk = None
+mp = None
+
+def _ensure_camera_libs():
+    """Import the vision stack the first time the camera is started"""
+    global cv2, Image, ImageTk, mp
+    if cv2 is None:
+        import cv2
+        from PIL import Image, ImageTk
+    if MEDIAPIPE_AVAILABLE and mp is None:
+        import mediapipe as mp
+
+# Sign language dictionary - mapping hand gestures to meanings
+_SIGN_DICT = {
+    "THUMBS_UP": "Yes/Good",
+    "THUMBS_DOWN": "No/Bad",
+    "OPEN_PALM": "Hello/Stop",
+    "CLOSED_FIST": "Wait",
+    "PEACE_SIGN": "Peace/Two",
+    "POINTING_UP": "Attention/Question",
+    "PINCH": "Small/Little"
+}
+
+# Sign language responses (in a real application these would be paths to
+# sign language videos or GIFs)
+_SIGN_RESPONSES = {sign: f"[Sign for: {meaning}]" for sign, meaning in _SIGN_DICT.items()}
+
+# Quick response shortcuts shown under the input field
+_QUICK_RESPONSES = ("Hello", "Thank you", "Yes", "No", "Help", "I need assistance")
+
+# Keyword matching is a single precompiled regex per table, built once at
+# import: one linear scan of the message, dispatching on the named group
+# that matched, instead of chains of any(word in text ...) checks
+_SIGN_REGEX = re.compile(
+    r"(?P<OPEN_PALM>hello|\bhi\b|\bhey\b|greet)|"
+    r"(?P<THUMBS_UP>\byes\b|good|\bok\b|okay|fine|agree)|"
+    r"(?P<THUMBS_DOWN>\bno\b|\bbad\b|wrong|disagree|don't)|"
+    r"(?P<CLOSED_FIST>wait|hold|stop|pause)|"
+    r"(?P<PEACE_SIGN>peace|\btwo\b|\b2\b|both)|"
+    r"(?P<POINTING_UP>question|what|how|when|where|why|\?)|"
+    r"(?P<PINCH>small|little|tiny|\bbit\b)",
+    re.IGNORECASE)
+
+_RESPONSE_REGEX = re.compile(
+    r"(?P<GREETING>hello|\bhi\b)|"
+    r"(?P<THANKS>thank)|"
+    r"(?P<HELP>help)|"
+    r"(?P<AGREE>\byes\b|yeah|\bok\b|sure)|"
+    r"(?P<DISAGREE>\bno\b|nope|don't|\bnot\b)",
+    re.IGNORECASE)
+
+# Maps the matched response group to (text, sign_key); a None sign keeps
+# the one already derived from the user's message
+_RESPONSE_TABLE = {
+    "GREETING": ("Hello! How can I help you today?", None),
+    "THANKS": ("You're welcome! Is there anything else you need?", "THUMBS_UP"),
+    "HELP": ("I'm here to help. You can use sign language or type your questions.", "OPEN_PALM"),
+    "AGREE": ("Great! What would you like to do next?", "THUMBS_UP"),
+    "DISAGREE": ("I understand. Let me know if you need something else.", "THUMBS_DOWN"),
+}
+
+# Bot replies to detected sign language input
+_SIGN_REPLY_TABLE = {
+    "THUMBS_UP": "Great! I'm glad you agree.",
+    "THUMBS_DOWN": "I understand you disagree or need something different.",
+    "OPEN_PALM": "Hello! How can I help you?",
+    "CLOSED_FIST": "I'll wait for your next instruction.",
+    "PEACE_SIGN": "Peace! Do you need help with two options?",
+    "POINTING_UP": "Do you have a question? I'm listening.",
+    "PINCH": "I understand you're referring to something small or precise.",
+}
+
+# How to perform each sign, shown in the guide window
+_SIGN_DESCRIPTIONS = {
+    "THUMBS_UP": "Extend thumb upward with other fingers closed to show approval or agreement.",
+    "THUMBS_DOWN": "Extend thumb downward with other fingers closed to show disapproval or disagreement.",
+    "OPEN_PALM": "Extend all fingers with palm facing forward to say hello or indicate stop.",
+    "CLOSED_FIST": "Close all fingers to form a fist to indicate wait or hold.",
+    "PEACE_SIGN": "Extend index and middle fingers while keeping other fingers closed to indicate peace or the number two.",
+    "POINTING_UP": "Extend only the index finger upward to indicate attention or to ask a question.",
+    "PINCH": "Touch the tips of thumb and index finger to indicate something small or precise."
+}
+
+def _build_gesture_table():
+    """Expand the gesture rules into a 64-entry lookup table.
+
+    The key packs thumb direction and the four finger-extended bits
+    (thumb_up | thumb_down << 1 | index << 2 | middle << 3 | ring << 4 |
+    pinky << 5); enumerating every combination here, in the same priority
+    order as the original rule cascade, turns per-frame classification
+    into a single table index.
+    """
+    table = []
+    for key in range(64):
+        thumb_up, thumb_down = key & 1, key & 2
+        index, middle, ring, pinky = key & 4, key & 8, key & 16, key & 32
+
+        # Thumbs up/down: thumb extended, index and middle closed
+        if thumb_up and not index and not middle:
+            sign = "THUMBS_UP"
+        elif thumb_down and not index and not middle:
+            sign = "THUMBS_DOWN"
+        # Open palm: all fingers extended
+        elif index and middle and ring and pinky:
+            sign = "OPEN_PALM"
+        # Closed fist: all fingers closed
+        elif not (index or middle or ring or pinky):
+            sign = "CLOSED_FIST"
+        # Peace sign: index and middle extended, others closed
+        elif index and middle and not ring and not pinky:
+            sign = "PEACE_SIGN"
+        # Pointing up: only index finger extended
+        elif index and not middle and not ring and not pinky:
+            sign = "POINTING_UP"
+        else:
+            sign = None
+        table.append(sign)
+    return tuple(table)
+
+_GESTURE_TABLE = _build_gesture_table()
+
 class SignLanguageChatbot:
+    # MediaPipe hand landmark indices used by the gesture rules
+    THUMB_IP = 3
+    THUMB_TIP = 4
+    INDEX_TIP = 8
+    FINGER_PIPS = np.array([6, 10, 14, 18])  # index, middle, ring, pinky
+    FINGER_TIPS = np.array([8, 12, 16, 20])
+
+    # Resolution hand tracking runs at; landmark accuracy saturates well
+    # below the camera resolution for a single close-up hand
+    DETECT_SIZE = (320, 240)
+
+    # Mean absolute thumbnail difference below which a frame counts as
+    # "nothing moved" and inference is skipped
+    MOTION_DIFF_THRESHOLD = 3.0
+
+    # A sign must be classified on this many consecutive frames, and at
+    # least this long must have passed since the last emission, before it
+    # produces chat messages
+    SIGN_STABLE_FRAMES = 5
+    SIGN_COOLDOWN_S = 1.5
+
     def __init__(self, root):
         self.root = root
         self.root.title("Sign Language Assistant")
@@ -49,41 +193,104 @@ class SignLanguageChatbot:
         self.video_capture = None
         self.camera_running = False
         self.sign_detection_running = False
+
+        # Timestamp cache: the HH:MM string only changes once a minute
+        self._ts_minute = None
+        self._ts_str = ""
+
+        # Camera pipeline hand-offs: capture -> inference -> render -> UI.
+        # All queues are bounded and drop the oldest frame when full, so a
+        # slow stage never stalls the ones before it.
+        self._stop_event = threading.Event()
+        self._workers = []
+        self._capture_queue = queue.Queue(maxsize=2)
+        self._render_queue = queue.Queue(maxsize=2)
+        self._frame_queue = queue.Queue(maxsize=1)
+        self._video_photo = None
+        self._canvas_img_id = None
+
+        # Coalesced UI updates: worker threads record pending changes here
+        # under the lock and the single _drain_ui loop applies them once
+        # per tick, instead of scheduling one Tk callback per event
+        self._ui_lock = threading.Lock()
+        self._ui_state = {}
+
+        # Preallocated output buffers for the per-frame cvtColor/resize
+        # calls, handed to OpenCV via dst=. Each ring is sized past the
+        # number of frames that can be in flight through the bounded
+        # queues, so steady state recycles the same memory instead of
+        # hitting the allocator for every frame.
+        self._rgb_ring = None  # sized once the camera resolution is known
+        self._rgb_index = 0
+        self._small_buf = np.empty((self.DETECT_SIZE[1], self.DETECT_SIZE[0], 3), np.uint8)
+        self._display_ring = [np.empty((480, 640, 3), np.uint8) for _ in range(3)]
+        self._display_index = 0
+        
+        # Text-to-speech engine; created lazily by _ensure_tts the first
+        # time audio is actually used
+        self.tts_engine = None
+        self._tts_queue = None
+
+        # Sign language detection variables; the MediaPipe graph is built
+        # lazily by _ensure_hands when sign mode is first enabled
+        self.mp_hands = None
+        self.mp_drawing = None
+        self.hands = None
+
+        # Run hand tracking only every Nth frame, reusing the previous
+        # landmarks in between (MediaPipe tracks the hand ROI across frames)
+        self._detect_interval = 2
+        self._frame_index = 0
+        self._last_results = None
+        self._prev_gray = None
+
+        # Memo for gesture classification, keyed on coarsely quantized
+        # landmark coordinates; a held gesture hits this nearly every frame
+        self._gesture_memo = {}
+        # Squared thumb-to-fingertip distances from the last classified
+        # frame, shared by any detector that cares about touching tips
+        self._last_tip_d2 = None
+        self._last_sign_label_text = None
+
+        # Debounce state: current classification streak and last time a
+        # sign was allowed to emit chat messages
+        self._sign_streak_sign = None
+        self._sign_streak_count = 0
+        self._last_emit_time = 0.0
         
-        # Initialize text-to-speech engine
-        if TTS_AVAILABLE:
-            self.tts_engine = pyttsx3.init()
-            self.tts_engine.setProperty('rate', 150)  # Speed of speech
-        
-        # Sign language detection variables
-        self.mp_hands = mp.solutions.hands if MEDIAPIPE_AVAILABLE else None
-        self.mp_drawing = mp.solutions.drawing_utils if MEDIAPIPE_AVAILABLE else None
-        self.hands = self.mp_hands.Hands(static_image_mode=False,
-                                      max_num_hands=2,
-                                      min_detection_confidence=0.5) if MEDIAPIPE_AVAILABLE else None
-        
-        # Sign language dictionary - mapping hand gestures to meanings
-        self.sign_dict = {
-            "THUMBS_UP": "Yes/Good",
-            "THUMBS_DOWN": "No/Bad",
-            "OPEN_PALM": "Hello/Stop",
-            "CLOSED_FIST": "Wait",
-            "PEACE_SIGN": "Peace/Two",
-            "POINTING_UP": "Attention/Question",
-            "PINCH": "Small/Little"
-        }
-        
-        # Sign language responses (images or animations)
-        self.sign_responses = self._load_sign_responses()
+        # Constant tables are built once at import; the instance just
+        # aliases them
+        self.sign_dict = _SIGN_DICT
+        self.sign_responses = _SIGN_RESPONSES
         
         # Current sign being shown as response
         self.current_response_sign = None
-        
-        # Messages list
-        self.messages = [
-            {"id": 1, "text": "Hello! I can detect sign language and respond with signs. How can I help you today?", 
-             "sender": "bot", "timestamp": self._get_timestamp(), "sign_key": "OPEN_PALM"}
-        ]
+
+        # Sign drawings are rendered onto the canvas at most once each,
+        # then toggled by tag instead of being redrawn per response
+        self._drawn_signs = set()
+        self._visible_sign = None
+
+        # The sign guide window is built once and re-shown on later opens
+        self._guide_window = None
+
+        # Reusable message dialog (built lazily by _show_message) and the
+        # pending auto-close callback id
+        self._msg_dialog = None
+        self._msg_text = None
+        self._msg_close_id = None
+        
+        # Message history is a capped ring buffer so a long session stays
+        # bounded; ids come from a counter instead of len(), and the last
+        # appended sender/text are tracked for the O(1) duplicate guard in
+        # _process_sign_language
+        self.messages = deque(maxlen=200)
+        self._next_id = 1
+        self._last_msg_sender = None
+        self._last_msg_text = None
+        self._add_message(
+            "Hello! I can detect sign language and respond with signs. How can I help you today?",
+            "bot", sign_key="OPEN_PALM")
         
         # Create UI elements
         self._create_ui()
@@ -99,19 +306,59 @@ class SignLanguageChatbot:
         if not TTS_AVAILABLE:
             self._show_message("Please install 'pyttsx3' package for text-to-speech features.")
 
-    def _load_sign_responses(self):
-        """
-        In a real application, this would load sign language animations or images
-        For this example, we'll simulate with descriptions and visual cues
-        """
-        responses = {}
-        
-        # In a real app, these would be paths to sign language videos or GIFs
-        for sign in self.sign_dict.keys():
-            responses[sign] = f"[Sign for: {self.sign_dict[sign]}]"
-            
-        return responses
-    
+    def _ensure_tts(self):
+        """Initialize the speech engine and its worker thread on first use"""
+        if self.tts_engine is not None:
+            return
+
+        import pyttsx3
+        self.tts_engine = pyttsx3.init()
+        self.tts_engine.setProperty('rate', 150)  # Speed of speech
+
+        # All speech goes through one long-lived worker thread, so the
+        # engine is only ever driven from a single thread. One pending
+        # slot: when speech falls behind, stale utterances are dropped
+        # in favor of the newest one.
+        self._tts_queue = queue.Queue(maxsize=1)
+        threading.Thread(target=self._tts_worker, daemon=True).start()
+
+    def _ensure_hands(self):
+        """Build the MediaPipe Hands graph on first use"""
+        if self.hands is not None or not MEDIAPIPE_AVAILABLE:
+            return
+
+        _ensure_camera_libs()
+        self.mp_hands = mp.solutions.hands
+        self.mp_drawing = mp.solutions.drawing_utils
+
+        # One hand with the lite landmark model: the gesture dictionary is
+        # single-handed, and model_complexity=0 roughly halves inference
+        # cost. The high tracking confidence keeps MediaPipe in its cheap
+        # landmark-only tracking mode (no palm re-detection) for as long
+        # as the hand is followed confidently.
+        self.hands = self.mp_hands.Hands(static_image_mode=False,
+                                      max_num_hands=1,
+                                      model_complexity=0,
+                                      min_detection_confidence=0.5,
+                                      min_tracking_confidence=0.7)
+
+    def _add_message(self, text, sender, sign_key=None):
+        """Create a message, append it to the capped history, and return it"""
+        message = {
+            "id": self._next_id,
+            "text": text,
+            "sender": sender,
+            "timestamp": self._get_timestamp()
+        }
+        if sign_key is not None:
+            message["sign_key"] = sign_key
+
+        self._next_id += 1
+        self.messages.append(message)
+        self._last_msg_sender = sender
+        self._last_msg_text = text
+        return message
+
     def _create_ui(self):
         # Main layout with left and right panes
         self.main_paned = ttk.PanedWindow(self.root, orient=tk.HORIZONTAL)
@@ -190,93 +437,100 @@ class SignLanguageChatbot:
         self.sign_visual_canvas.pack(fill=tk.X, expand=True, padx=5, pady=5)
         
         # Create default sign image (blank hand)
-        self._draw_default_hand()
-        
-    def _draw_default_hand(self):
-        """Draw a simple hand outline on the canvas"""
-        self.sign_visual_canvas.delete("all")
-        
-        # Draw a simple hand outline
-        width = self.sign_visual_canvas.winfo_width() or 300
-        height = self.sign_visual_canvas.winfo_height() or 150
-        
-        # Draw hand outline in center
-        cx, cy = width/2, height/2
-        
-        # Draw palm
-        self.sign_visual_canvas.create_oval(cx-30, cy-20, cx+30, cy+40, outline="gray", width=2)
-        
-        # Draw fingers
-        # Thumb
-        self.sign_visual_canvas.create_line(cx-30, cy, cx-50, cy-30, smooth=True, width=2, fill="gray")
-        # Index
-        self.sign_visual_canvas.create_line(cx-15, cy-20, cx-15, cy-70, smooth=True, width=2, fill="gray")
-        # Middle
-        self.sign_visual_canvas.create_line(cx, cy-20, cx, cy-80, smooth=True, width=2, fill="gray")
-        # Ring
-        self.sign_visual_canvas.create_line(cx+15, cy-20, cx+15, cy-70, smooth=True, width=2, fill="gray") 
-        # Pinky
-        self.sign_visual_canvas.create_line(cx+30, cy-20, cx+30, cy-60, smooth=True, width=2, fill="gray")
-        
-        # Add text
-        self.sign_visual_canvas.create_text(cx, cy+70, text="Ready for sign response", fill="gray")
-        
+        self._draw_sign(None)
+
     def _draw_sign(self, sign_key):
-        """Draw sign language visualization based on sign key"""
-        self.sign_visual_canvas.delete("all")
-        
+        """Show the sign visualization, rendering its canvas items at most once
+
+        Each sign's drawing primitives are created once under a per-sign
+        tag and toggled with itemconfigure afterwards, so showing a bot
+        response costs two Tcl calls instead of re-issuing every
+        create_oval/create_rectangle/create_text.
+        """
+        if sign_key not in self.sign_dict:
+            sign_key = "DEFAULT"
+
+        if sign_key not in self._drawn_signs:
+            self._render_sign_items(sign_key)
+            self._drawn_signs.add(sign_key)
+
+        if self._visible_sign != sign_key:
+            if self._visible_sign is not None:
+                self.sign_visual_canvas.itemconfigure(self._visible_sign, state="hidden")
+            self.sign_visual_canvas.itemconfigure(sign_key, state="normal")
+            self._visible_sign = sign_key
+
+    def _render_sign_items(self, sign_key):
+        """Draw sign language visualization onto the canvas under its tag"""
         width = self.sign_visual_canvas.winfo_width() or 300
         height = self.sign_visual_canvas.winfo_height() or 150
         cx, cy = width/2, height/2
-        
+
         if sign_key == "THUMBS_UP":
             # Draw thumbs up
-            self.sign_visual_canvas.create_oval(cx-20, cy-20, cx+20, cy+20, fill="#4a6fa5", outline="black")
-            self.sign_visual_canvas.create_rectangle(cx-15, cy, cx+15, cy+60, fill="#4a6fa5", outline="black")
-            self.sign_visual_canvas.create_line(cx-15, cy+60, cx+15, cy+60, width=2)
-            self.sign_visual_canvas.create_text(cx, cy+80, text="THUMBS UP - Yes/Good", font=("Arial", 12, "bold"))
-            
+            self.sign_visual_canvas.create_oval(cx-20, cy-20, cx+20, cy+20, fill="#4a6fa5", outline="black", tags=sign_key)
+            self.sign_visual_canvas.create_rectangle(cx-15, cy, cx+15, cy+60, fill="#4a6fa5", outline="black", tags=sign_key)
+            self.sign_visual_canvas.create_line(cx-15, cy+60, cx+15, cy+60, width=2, tags=sign_key)
+            self.sign_visual_canvas.create_text(cx, cy+80, text="THUMBS UP - Yes/Good", font=("Arial", 12, "bold"), tags=sign_key)
+
         elif sign_key == "THUMBS_DOWN":
             # Draw thumbs down
-            self.sign_visual_canvas.create_oval(cx-20, cy-20, cx+20, cy+20, fill="#4a6fa5", outline="black")
-            self.sign_visual_canvas.create_rectangle(cx-15, cy-60, cx+15, cy, fill="#4a6fa5", outline="black")
-            self.sign_visual_canvas.create_line(cx-15, cy-60, cx+15, cy-60, width=2)
-            self.sign_visual_canvas.create_text(cx, cy+40, text="THUMBS DOWN - No/Bad", font=("Arial", 12, "bold"))
-            
+            self.sign_visual_canvas.create_oval(cx-20, cy-20, cx+20, cy+20, fill="#4a6fa5", outline="black", tags=sign_key)
+            self.sign_visual_canvas.create_rectangle(cx-15, cy-60, cx+15, cy, fill="#4a6fa5", outline="black", tags=sign_key)
+            self.sign_visual_canvas.create_line(cx-15, cy-60, cx+15, cy-60, width=2, tags=sign_key)
+            self.sign_visual_canvas.create_text(cx, cy+40, text="THUMBS DOWN - No/Bad", font=("Arial", 12, "bold"), tags=sign_key)
+
         elif sign_key == "OPEN_PALM":
             # Draw open palm
-            self.sign_visual_canvas.create_oval(cx-30, cy+30, cx+30, cy+70, fill="#4a6fa5", outline="black")
+            self.sign_visual_canvas.create_oval(cx-30, cy+30, cx+30, cy+70, fill="#4a6fa5", outline="black", tags=sign_key)
             # Draw fingers up
             for i in range(-20, 30, 10):
-                self.sign_visual_canvas.create_rectangle(cx+i-5, cy-50, cx+i+5, cy+30, fill="#4a6fa5", outline="black")
-            self.sign_visual_canvas.create_text(cx, cy+90, text="OPEN PALM - Hello/Stop", font=("Arial", 12, "bold"))
-            
+                self.sign_visual_canvas.create_rectangle(cx+i-5, cy-50, cx+i+5, cy+30, fill="#4a6fa5", outline="black", tags=sign_key)
+            self.sign_visual_canvas.create_text(cx, cy+90, text="OPEN PALM - Hello/Stop", font=("Arial", 12, "bold"), tags=sign_key)
+
         elif sign_key == "CLOSED_FIST":
             # Draw closed fist
-            self.sign_visual_canvas.create_oval(cx-30, cy-30, cx+30, cy+30, fill="#4a6fa5", outline="black")
-            self.sign_visual_canvas.create_text(cx, cy+50, text="CLOSED FIST - Wait", font=("Arial", 12, "bold"))
-            
+            self.sign_visual_canvas.create_oval(cx-30, cy-30, cx+30, cy+30, fill="#4a6fa5", outline="black", tags=sign_key)
+            self.sign_visual_canvas.create_text(cx, cy+50, text="CLOSED FIST - Wait", font=("Arial", 12, "bold"), tags=sign_key)
+
         elif sign_key == "PEACE_SIGN":
             # Draw peace sign
-            self.sign_visual_canvas.create_oval(cx-25, cy+20, cx+25, cy+60, fill="#4a6fa5", outline="black")
-            self.sign_visual_canvas.create_rectangle(cx-20, cy, cx-5, cy-50, fill="#4a6fa5", outline="black")
-            self.sign_visual_canvas.create_rectangle(cx+5, cy, cx+20, cy-50, fill="#4a6fa5", outline="black")
-            self.sign_visual_canvas.create_text(cx, cy+80, text="PEACE SIGN - Peace/Two", font=("Arial", 12, "bold"))
-            
+            self.sign_visual_canvas.create_oval(cx-25, cy+20, cx+25, cy+60, fill="#4a6fa5", outline="black", tags=sign_key)
+            self.sign_visual_canvas.create_rectangle(cx-20, cy, cx-5, cy-50, fill="#4a6fa5", outline="black", tags=sign_key)
+            self.sign_visual_canvas.create_rectangle(cx+5, cy, cx+20, cy-50, fill="#4a6fa5", outline="black", tags=sign_key)
+            self.sign_visual_canvas.create_text(cx, cy+80, text="PEACE SIGN - Peace/Two", font=("Arial", 12, "bold"), tags=sign_key)
+
         elif sign_key == "POINTING_UP":
             # Draw pointing up
-            self.sign_visual_canvas.create_oval(cx-25, cy+30, cx+25, cy+70, fill="#4a6fa5", outline="black")
-            self.sign_visual_canvas.create_rectangle(cx-5, cy-60, cx+5, cy+30, fill="#4a6fa5", outline="black")
-            self.sign_visual_canvas.create_text(cx, cy+90, text="POINTING UP - Question/Attention", font=("Arial", 12, "bold"))
-            
+            self.sign_visual_canvas.create_oval(cx-25, cy+30, cx+25, cy+70, fill="#4a6fa5", outline="black", tags=sign_key)
+            self.sign_visual_canvas.create_rectangle(cx-5, cy-60, cx+5, cy+30, fill="#4a6fa5", outline="black", tags=sign_key)
+            self.sign_visual_canvas.create_text(cx, cy+90, text="POINTING UP - Question/Attention", font=("Arial", 12, "bold"), tags=sign_key)
+
         elif sign_key == "PINCH":
             # Draw pinch gesture
-            self.sign_visual_canvas.create_oval(cx-25, cy+20, cx+25, cy+60, fill="#4a6fa5", outline="black")
-            self.sign_visual_canvas.create_arc(cx-20, cy-30, cx+20, cy+10, start=0, extent=180, outline="black", width=2)
-            self.sign_visual_canvas.create_text(cx, cy+80, text="PINCH - Small/Little", font=("Arial", 12, "bold"))
-            
+            self.sign_visual_canvas.create_oval(cx-25, cy+20, cx+25, cy+60, fill="#4a6fa5", outline="black", tags=sign_key)
+            self.sign_visual_canvas.create_arc(cx-20, cy-30, cx+20, cy+10, start=0, extent=180, outline="black", width=2, tags=sign_key)
+            self.sign_visual_canvas.create_text(cx, cy+80, text="PINCH - Small/Little", font=("Arial", 12, "bold"), tags=sign_key)
+
         else:
-            self._draw_default_hand()
+            # Default: a simple hand outline
+            # Draw palm
+            self.sign_visual_canvas.create_oval(cx-30, cy-20, cx+30, cy+40, outline="gray", width=2, tags=sign_key)
+
+            # Draw fingers
+            # Thumb
+            self.sign_visual_canvas.create_line(cx-30, cy, cx-50, cy-30, smooth=True, width=2, fill="gray", tags=sign_key)
+            # Index
+            self.sign_visual_canvas.create_line(cx-15, cy-20, cx-15, cy-70, smooth=True, width=2, fill="gray", tags=sign_key)
+            # Middle
+            self.sign_visual_canvas.create_line(cx, cy-20, cx, cy-80, smooth=True, width=2, fill="gray", tags=sign_key)
+            # Ring
+            self.sign_visual_canvas.create_line(cx+15, cy-20, cx+15, cy-70, smooth=True, width=2, fill="gray", tags=sign_key)
+            # Pinky
+            self.sign_visual_canvas.create_line(cx+30, cy-20, cx+30, cy-60, smooth=True, width=2, fill="gray", tags=sign_key)
+
+            # Add text
+            self.sign_visual_canvas.create_text(cx, cy+70, text="Ready for sign response", fill="gray", tags=sign_key)
     
     def _create_chat_area(self):
         # Chat header
@@ -337,9 +591,7 @@ class SignLanguageChatbot:
         self.quick_responses_frame = ttk.Frame(self.right_frame)
         self.quick_responses_frame.pack(fill=tk.X, padx=5, pady=(0, 5))
         
-        quick_responses = ["Hello", "Thank you", "Yes", "No", "Help", "I need assistance"]
-        
-        for i, response in enumerate(quick_responses):
+        for i, response in enumerate(_QUICK_RESPONSES):
             btn = ttk.Button(self.quick_responses_frame, text=response, 
                            command=lambda r=response: self._use_quick_response(r))
             row = i // 3
@@ -365,39 +617,53 @@ class SignLanguageChatbot:
         style.configure("TButton", font=("Arial", 10))
         
     def _display_messages(self):
+        """Render the full message history; only used for the initial load"""
         self.chat_display.config(state="normal")
         self.chat_display.delete(1.0, tk.END)
-        
+        self.chat_display.config(state="disabled")
+
         for msg in self.messages:
-            tag = msg["sender"]
-            prefix = f"[{msg['timestamp']}] "
-            
-            # Add sender prefix for better distinction
-            if tag == "bot":
-                prefix += "Bot: "
-            elif tag == "sign":
-                prefix += "Sign Detected: "
-            else:
-                prefix += "You: "
-                
-            message_with_prefix = prefix + msg["text"] + "\n\n"
-            self.chat_display.insert(tk.END, message_with_prefix, tag)
-            
-            # If there's a sign response, update the sign response label
-            if "sign_key" in msg and msg["sender"] == "bot":
-                self._update_sign_response(msg["sign_key"])
-            
+            self._append_message(msg)
+
+    def _append_message(self, msg):
+        """Append a single new message to the chat display.
+
+        Appending only the new message keeps per-turn UI work constant
+        instead of re-rendering the whole transcript on every update.
+        """
+        tag = msg["sender"]
+        prefix = f"[{msg['timestamp']}] "
+
+        # Add sender prefix for better distinction
+        if tag == "bot":
+            prefix += "Bot: "
+        elif tag == "sign":
+            prefix += "Sign Detected: "
+        else:
+            prefix += "You: "
+
+        self.chat_display.config(state="normal")
+        self.chat_display.insert(tk.END, prefix + msg["text"] + "\n\n", tag)
         self.chat_display.config(state="disabled")
         self.chat_display.see(tk.END)  # Auto-scroll to the end
+
+        # Only a new bot message changes the sign response panel
+        if "sign_key" in msg and msg["sender"] == "bot":
+            self._update_sign_response(msg["sign_key"])
     
     def _update_sign_response(self, sign_key):
+        # Repeated signs are common (every bot turn re-reports its sign);
+        # skip the label update and canvas work when nothing changed
+        if sign_key is not None and sign_key == self.current_response_sign:
+            return
+
         if sign_key in self.sign_responses:
             self.sign_response_label.config(text=self.sign_responses[sign_key])
             self._draw_sign(sign_key)
             self.current_response_sign = sign_key
         else:
             self.sign_response_label.config(text="No sign response available")
-            self._draw_default_hand()
+            self._draw_sign(None)
             self.current_response_sign = None
             
     def _send_message(self):
@@ -406,18 +672,13 @@ class SignLanguageChatbot:
             return
             
         # Add user message
-        self.messages.append({
-            "id": len(self.messages) + 1,
-            "text": message_text,
-            "sender": "user",
-            "timestamp": self._get_timestamp()
-        })
-        
+        message = self._add_message(message_text, "user")
+
         # Clear input field
         self.text_input.delete(0, tk.END)
-        
+
         # Update display
-        self._display_messages()
+        self._append_message(message)
         
         # Process user's text and determine appropriate sign language response
         sign_key = self._text_to_sign(message_text)
@@ -427,71 +688,56 @@ class SignLanguageChatbot:
     
     def _text_to_sign(self, text):
         """Convert text input to appropriate sign language response"""
-        text = text.lower()
-        
-        # Simple rule-based mapping for this example
-        if any(word in text for word in ["hello", "hi", "hey", "greet"]):
-            return "OPEN_PALM"
-        elif any(word in text for word in ["yes", "good", "ok", "okay", "fine", "agree"]):
-            return "THUMBS_UP"
-        elif any(word in text for word in ["no", "bad", "wrong", "disagree", "don't"]):
-            return "THUMBS_DOWN"
-        elif any(word in text for word in ["wait", "hold", "stop", "pause"]):
-            return "CLOSED_FIST"
-        elif any(word in text for word in ["peace", "two", "2", "both"]):
-            return "PEACE_SIGN"
-        elif any(word in text for word in ["question", "what", "how", "when", "where", "why", "?"]):
-            return "POINTING_UP"
-        elif any(word in text for word in ["small", "little", "tiny", "bit"]):
-            return "PINCH"
-        else:
-            # Default response
-            return "OPEN_PALM"
-        
+        # One scan over the message; the named group tells us the sign
+        match = _SIGN_REGEX.search(text)
+
+        # Default response when no keyword matches
+        return match.lastgroup if match else "OPEN_PALM"
+
     def _send_bot_response(self, user_message, sign_key):
         # In a real app, this would connect to a backend or AI service
-        
+
         # Generate different responses based on user input
-        if "hello" in user_message.lower() or "hi" in user_message.lower():
-            response_text = "Hello! How can I help you today?"
-        elif "thank" in user_message.lower():
-            response_text = "You're welcome! Is there anything else you need?"
-            sign_key = "THUMBS_UP"
-        elif "help" in user_message.lower():
-            response_text = "I'm here to help. You can use sign language or type your questions."
-            sign_key = "OPEN_PALM"
-        elif any(word in user_message.lower() for word in ["yes", "yeah", "ok", "sure"]):
-            response_text = "Great! What would you like to do next?"
-            sign_key = "THUMBS_UP"
-        elif any(word in user_message.lower() for word in ["no", "nope", "don't", "not"]):
-            response_text = "I understand. Let me know if you need something else."
-            sign_key = "THUMBS_DOWN"
+        match = _RESPONSE_REGEX.search(user_message)
+        if match:
+            response_text, matched_sign = _RESPONSE_TABLE[match.lastgroup]
+            if matched_sign:
+                sign_key = matched_sign
         else:
             response_text = "I understand your message. How else can I assist you?"
         
         # Add bot response
-        self.messages.append({
-            "id": len(self.messages) + 1,
-            "text": response_text,
-            "sender": "bot",
-            "timestamp": self._get_timestamp(),
-            "sign_key": sign_key
-        })
-        
-        self._display_messages()
+        message = self._add_message(response_text, "bot", sign_key=sign_key)
+
+        self._append_message(message)
         
         # Speak the response if audio is enabled
         if self.is_audio_enabled and TTS_AVAILABLE:
             self._speak_text(response_text)
         
     def _speak_text(self, text):
-        """Use text-to-speech to speak the given text"""
+        """Queue the given text for the text-to-speech worker.
+
+        Replaces any still-pending utterance rather than blocking, so
+        rapid messages coalesce to the newest one while speech catches up.
+        """
         if not TTS_AVAILABLE:
             return
-            
-        # Create and start a thread for TTS to avoid UI freezing
-        threading.Thread(target=lambda: self.tts_engine.say(text) or self.tts_engine.runAndWait(), 
-                       daemon=True).start()
+
+        self._ensure_tts()
+        self._put_latest(self._tts_queue, text)
+
+    def _tts_worker(self):
+        """Speak queued texts one at a time on a dedicated thread.
+
+        pyttsx3 engines are not reliably thread-safe across threads, and
+        the previous thread-per-utterance approach also paid thread
+        startup cost on every message.
+        """
+        while True:
+            text = self._tts_queue.get()
+            self.tts_engine.say(text)
+            self.tts_engine.runAndWait()
         
     def _use_quick_response(self, response):
         self.text_input.delete(0, tk.END)
@@ -510,12 +756,12 @@ class SignLanguageChatbot:
             self.camera_status_label.config(text="Camera Off - Click '📹 Camera' to start")
             self.camera_status_label.place(relx=0.5, rely=0.5, anchor=tk.CENTER)
             
-            # Stop the camera if it's running
+            # Stop the camera pipeline if it's running; the capture
+            # thread releases the camera on its way out
             if self.camera_running:
                 self.camera_running = False
-                if self.video_capture:
-                    self.video_capture.release()
-                    
+                self._stop_event.set()
+
             # If sign language mode is on, turn it off
             if self.is_sign_language_mode:
                 self._toggle_sign_language()
@@ -531,215 +777,347 @@ class SignLanguageChatbot:
         if not CAMERA_AVAILABLE:
             self.camera_status_label.config(text="Camera not available. Install OpenCV and PIL.")
             return
-            
-        # Start the camera in a separate thread
+
+        _ensure_camera_libs()
+
+        # Start the three pipeline stages as daemon threads. Each stage
+        # runs at its own pace; bounded queues between them drop stale
+        # frames, so throughput is set by the slowest stage (MediaPipe)
+        # instead of the sum of all stages.
+        # Workers from a previous camera session must be fully stopped
+        # before the stop event is cleared, or they would resume running
+        # alongside the new stage threads
+        self._stop_event.set()
+        for worker in self._workers:
+            worker.join(timeout=1.0)
+
         self.camera_running = True
-        threading.Thread(target=self._camera_thread, daemon=True).start()
-            
-    def _camera_thread(self):
-        # This function requires OpenCV and PIL
-        if not CAMERA_AVAILABLE:
-            return
-            
+        self._stop_event.clear()
+
+        # Flush anything a previous camera session left behind so the UI
+        # never shows a stale frame on restart
+        for pending in (self._capture_queue, self._render_queue, self._frame_queue):
+            while True:
+                try:
+                    pending.get_nowait()
+                except queue.Empty:
+                    break
+
+        # Detection state from a previous camera session must not leak
+        # into the new one: stale landmarks would otherwise be "reused"
+        # by the motion gate until the user moves
+        self._last_results = None
+        self._prev_gray = None
+        self._frame_index = 0
+
+        self._workers = [
+            threading.Thread(target=target, daemon=True)
+            for target in (self._capture_loop, self._inference_loop, self._render_loop)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+        # One UI drain tick services everything the workers produced
+        self.root.after(16, self._drain_ui)
+
+    @staticmethod
+    def _put_latest(frame_queue, item):
+        """Put an item on a bounded queue, dropping the oldest when full"""
+        while True:
+            try:
+                frame_queue.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    frame_queue.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def _capture_loop(self):
+        """Pipeline stage 1: read frames from the camera"""
         try:
             # Open the camera
             self.video_capture = cv2.VideoCapture(0)
-            
+
             if not self.video_capture.isOpened():
                 self.root.after(0, lambda: self.camera_status_label.config(
                     text="Could not access camera. Check permissions."
                 ))
                 self.camera_running = False
                 return
-                
+
             self.root.after(0, lambda: self.camera_status_label.place_forget())
-            
-            while self.camera_running:
+
+            while not self._stop_event.is_set():
                 ret, frame = self.video_capture.read()
                 if ret:
-                    # If sign language detection is on, process the frame
-                    if self.is_sign_language_mode and MEDIAPIPE_AVAILABLE:
-                        frame = self._process_sign_language(frame)
-                    
-                    # Convert the frame to a format that Tkinter can display
-                    frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                    frame = cv2.resize(frame, (640, 480))
-                    img = Image.fromarray(frame)
-                    imgtk = ImageTk.PhotoImage(image=img)
-                    
-                    # Update the canvas with the new frame
-                    self.root.after(0, lambda f=imgtk: self._update_video_canvas(f))
-                
+                    if self._rgb_ring is None or self._rgb_ring[0].shape != frame.shape:
+                        self._rgb_ring = [np.empty_like(frame) for _ in range(8)]
+
+                    # The one color conversion in the whole pipeline:
+                    # MediaPipe, landmark drawing, and the Tk display all
+                    # consume this RGB frame directly, so no stage needs
+                    # to convert back and forth
+                    rgb = self._rgb_ring[self._rgb_index]
+                    self._rgb_index = (self._rgb_index + 1) % len(self._rgb_ring)
+                    cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=rgb)
+                    self._put_latest(self._capture_queue, rgb)
+
                 time.sleep(0.03)  # Approximately 30 fps
-                
-            # Release the camera when the thread ends
-            if self.video_capture:
-                self.video_capture.release()
         except Exception as e:
             self.root.after(0, lambda: self._show_message(f"Camera error: {str(e)}"))
             self.camera_running = False
+        finally:
+            # Release the camera when the thread ends
+            if self.video_capture:
+                self.video_capture.release()
+
+    def _inference_loop(self):
+        """Pipeline stage 2: run sign language detection on frames"""
+        while not self._stop_event.is_set():
+            try:
+                frame = self._capture_queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+
+            # If sign language detection is on, process the frame
+            if self.is_sign_language_mode and MEDIAPIPE_AVAILABLE:
+                frame = self._process_sign_language(frame)
+
+            self._put_latest(self._render_queue, frame)
+
+    def _render_loop(self):
+        """Pipeline stage 3: convert frames and hand them to the UI"""
+        while not self._stop_event.is_set():
+            try:
+                frame = self._render_queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+
+            # Scale the frame to the display size; it is already RGB
+            display = self._display_ring[self._display_index]
+            self._display_index = (self._display_index + 1) % len(self._display_ring)
+            cv2.resize(frame, (640, 480), dst=display)
+
+            # The _drain_ui loop picks this up on its next tick
+            self._put_latest(self._frame_queue, display)
     
     def _process_sign_language(self, frame):
-        """Process frame for sign language detection"""
-        if not MEDIAPIPE_AVAILABLE:
+        """Process an RGB frame for sign language detection"""
+        if not MEDIAPIPE_AVAILABLE or self.hands is None:
             return frame
             
-        # Convert to RGB for MediaPipe
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        
-        # Process the frame with MediaPipe Hands
-        results = self.hands.process(rgb_frame)
-        
-        # Convert back to BGR for OpenCV
-        frame = cv2.cvtColor(rgb_frame, cv2.COLOR_RGB2BGR)
-        
-        # If hands are detected
-        if results.multi_hand_landmarks:
-            # Draw hand landmarks on the frame
-            for hand_landmarks in results.multi_hand_landmarks:
-                self.mp_drawing.draw_landmarks(
-                    frame, hand_landmarks, self.mp_hands.HAND_CONNECTIONS)
-                
-                # Analyze hand gesture
-                detected_sign = self._recognize_hand_gesture(hand_landmarks)
-                
-                if detected_sign:
-                    # Update UI with detected sign
-                    self.root.after(0, lambda sign=detected_sign: self._update_sign_detection(sign))
-                    
-                    # Add sign detection message if it's a new detection
-                    if (not self.messages or 
-                        self.messages[-1]["sender"] != "sign" or
-                        self.messages[-1]["text"] != self.sign_dict.get(detected_sign, "Unknown sign")):
-                        
-                        self.messages.append({
-                            "id": len(self.messages) + 1,
-                            "text": self.sign_dict.get(detected_sign, "Unknown sign"),
-                            "sender": "sign",
-                            "timestamp": self._get_timestamp(),
-                            "sign_key": detected_sign
-                        })
-                        
-                        # Update display with the new message
-                        self.root.after(0, self._display_messages)
-                        
-                        # Auto-respond to sign language input
-                        self.root.after(1000, lambda s=detected_sign: self._respond_to_sign(s))
+        # Hand tracking is the heaviest stage of the pipeline, so run it on
+        # a quarter-size frame and only every Nth frame. MediaPipe already
+        # caches the hand ROI across frames, so the skipped frames and the
+        # lower resolution cost almost nothing in accuracy.
+        self._frame_index += 1
+        run_inference = (self._frame_index % self._detect_interval == 0
+                         or self._last_results is None)
+
+        # Cheap motion gate: compare a grayscale thumbnail against the
+        # previous frame's and skip MediaPipe entirely when nothing moved.
+        # Idle scenes dominate a chat session, and the gate itself costs
+        # a fraction of a millisecond.
+        gray = cv2.resize(frame, (80, 60), interpolation=cv2.INTER_NEAREST)
+        gray = cv2.cvtColor(gray, cv2.COLOR_RGB2GRAY)
+        if (run_inference and self._prev_gray is not None
+                and self._last_results is not None
+                and cv2.absdiff(gray, self._prev_gray).mean() < self.MOTION_DIFF_THRESHOLD):
+            run_inference = False
+        self._prev_gray = gray
+
+        if not run_inference:
+            results = self._last_results
+        else:
+            small = self._small_buf
+            small.flags.writeable = True  # undo the flag from the last pass
+            cv2.resize(frame, self.DETECT_SIZE, dst=small, interpolation=cv2.INTER_NEAREST)
+            # Marking the input read-only lets MediaPipe reference the
+            # array directly instead of copying it into its graph
+            small.flags.writeable = False
+            self._last_results = results = self.hands.process(small)
+
+        # Fast path: nothing to draw or classify when no hand is in view,
+        # which is most frames of a typical session
+        if not results.multi_hand_landmarks:
+            return frame
+
+        # Landmarks are normalized, so they draw correctly on the
+        # full-resolution frame even though detection ran downscaled
+        for hand_landmarks in results.multi_hand_landmarks:
+            self.mp_drawing.draw_landmarks(
+                frame, hand_landmarks, self.mp_hands.HAND_CONNECTIONS)
+
+            # Analyze hand gesture
+            detected_sign = self._recognize_hand_gesture(hand_landmarks)
+
+            if detected_sign:
+                # Record the detected sign for the next UI drain tick
+                with self._ui_lock:
+                    self._ui_state["sign"] = detected_sign
+
+                # Debounce: a single noisy frame must not flood the chat.
+                # Count the classification streak and only emit once it is
+                # stable and the cool-down since the last emission passed.
+                if detected_sign == self._sign_streak_sign:
+                    self._sign_streak_count += 1
+                else:
+                    self._sign_streak_sign = detected_sign
+                    self._sign_streak_count = 1
+
+                now = time.time()
+                if (self._sign_streak_count != self.SIGN_STABLE_FRAMES or
+                        now - self._last_emit_time < self.SIGN_COOLDOWN_S):
+                    continue
+
+                # Add sign detection message if it's a new detection
+                sign_text = self.sign_dict.get(detected_sign, "Unknown sign")
+                if (self._last_msg_sender != "sign" or
+                        self._last_msg_text != sign_text):
+                    self._last_emit_time = now
+
+                    message = self._add_message(sign_text, "sign",
+                                                sign_key=detected_sign)
+
+                    with self._ui_lock:
+                        self._ui_state.setdefault("new_msgs", []).append(message)
+
+                    # Auto-respond to sign language input
+                    self.root.after(1000, lambda s=detected_sign: self._respond_to_sign(s))
         
         return frame
     
-    def _recognize_hand_gesture(self, hand_landmarks):
+    def _recognize_hand_gesture(self, hand_landmarks,
+                                _table=_GESTURE_TABLE,
+                                _tips=FINGER_TIPS, _pips=FINGER_PIPS,
+                                _thumb_tip=THUMB_TIP, _thumb_ip=THUMB_IP):
         """Recognize hand gesture from landmarks"""
-        # Extract key points from hand landmarks
-        thumb_tip = hand_landmarks.landmark[self.mp_hands.HandLandmark.THUMB_TIP]
-        thumb_ip = hand_landmarks.landmark[self.mp_hands.HandLandmark.THUMB_IP]
-        index_tip = hand_landmarks.landmark[self.mp_hands.HandLandmark.INDEX_FINGER_TIP]
-        index_pip = hand_landmarks.landmark[self.mp_hands.HandLandmark.INDEX_FINGER_PIP]
-        middle_tip = hand_landmarks.landmark[self.mp_hands.HandLandmark.MIDDLE_FINGER_TIP]
-        middle_pip = hand_landmarks.landmark[self.mp_hands.HandLandmark.MIDDLE_FINGER_PIP]
-        ring_tip = hand_landmarks.landmark[self.mp_hands.HandLandmark.RING_FINGER_TIP]
-        ring_pip = hand_landmarks.landmark[self.mp_hands.HandLandmark.RING_FINGER_PIP]
-        pinky_tip = hand_landmarks.landmark[self.mp_hands.HandLandmark.PINKY_TIP]
-        pinky_pip = hand_landmarks.landmark[self.mp_hands.HandLandmark.PINKY_PIP]
-        wrist = hand_landmarks.landmark[self.mp_hands.HandLandmark.WRIST]
-        
-        # Simple gesture recognition based on finger positions
-        # Thumbs up: thumb extended upward, other fingers closed
-        if (thumb_tip.y < thumb_ip.y and 
-            index_tip.y > index_pip.y and 
-            middle_tip.y > middle_pip.y):
-            return "THUMBS_UP"
-            
-        # Thumbs down: thumb extended downward, other fingers closed
-        elif (thumb_tip.y > thumb_ip.y and 
-              index_tip.y > index_pip.y and 
-              middle_tip.y > middle_pip.y):
-            return "THUMBS_DOWN"
-            
-        # Open palm: all fingers extended
-        elif (index_tip.y < index_pip.y and 
-              middle_tip.y < middle_pip.y and 
-              ring_tip.y < ring_pip.y and 
-              pinky_tip.y < pinky_pip.y):
-            return "OPEN_PALM"
-            
-        # Closed fist: all fingers closed
-        elif (index_tip.y > index_pip.y and 
-              middle_tip.y > middle_pip.y and 
-              ring_tip.y > ring_pip.y and 
-              pinky_tip.y > pinky_pip.y):
-            return "CLOSED_FIST"
-            
-        # Peace sign: index and middle fingers extended, others closed
-        elif (index_tip.y < index_pip.y and 
-              middle_tip.y < middle_pip.y and 
-              ring_tip.y > ring_pip.y and 
-              pinky_tip.y > pinky_pip.y):
-            return "PEACE_SIGN"
-            
-        # Pointing up: only index finger extended
-        elif (index_tip.y < index_pip.y and 
-              middle_tip.y > middle_pip.y and 
-              ring_tip.y > ring_pip.y and 
-              pinky_tip.y > pinky_pip.y):
-            return "POINTING_UP"
-            
-        # Pinch gesture: thumb and index finger form an 'O'
-        elif (abs(thumb_tip.x - index_tip.x) < 0.05 and 
-              abs(thumb_tip.y - index_tip.y) < 0.05):
-            return "PINCH"
-            
-        return None  # No recognized gesture
+        # Pull all 21 landmarks into one (21, 3) array up front so the
+        # gesture rules below are array comparisons instead of dozens of
+        # attribute lookups through the MediaPipe protobuf wrappers.
+        pts = np.fromiter(
+            (coord for lm in hand_landmarks.landmark for coord in (lm.x, lm.y, lm.z)),
+            dtype=np.float32, count=63).reshape(21, 3)
+
+        # Held gestures produce near-identical landmarks frame after frame;
+        # quantizing the coordinates gives a stable key with a very high
+        # hit rate on a steady hand, skipping re-classification entirely
+        memo_key = (pts[:, :2] * 50).astype(np.int8).tobytes()
+        try:
+            return self._gesture_memo[memo_key]
+        except KeyError:
+            pass
+
+        # The landmark indices and the dispatch table are bound as default
+        # arguments above, so this per-frame path runs on local loads with
+        # no attribute or global lookups left in it
+        thumb_tip_y = pts[_thumb_tip, 1]
+        thumb_ip_y = pts[_thumb_ip, 1]
+        extended = pts[_tips, 1] < pts[_pips, 1]
+
+        # Pack thumb direction and finger extension into a 6-bit key and
+        # dispatch through the precomputed table instead of a rule cascade
+        key = (int(thumb_tip_y < thumb_ip_y)
+               | int(thumb_tip_y > thumb_ip_y) << 1
+               | int(extended[0]) << 2
+               | int(extended[1]) << 3
+               | int(extended[2]) << 4
+               | int(extended[3]) << 5)
+        sign = _table[key]
+
+        # Pinch gesture: thumb and index finger form an 'O'; only worth
+        # checking when no finger-extension pattern matched. One broadcast
+        # subtraction gives the squared thumb-to-tip distance for all four
+        # fingers at once (0.05**2 covers the same circle with no square
+        # root); the array is kept around so additional touch-based
+        # gestures can read it without recomputing.
+        if sign is None:
+            deltas = pts[_tips, :2] - pts[_thumb_tip, :2]
+            self._last_tip_d2 = d2 = (deltas * deltas).sum(axis=1)
+            if d2[0] < 0.0025:
+                sign = "PINCH"
+
+        if len(self._gesture_memo) >= 64:
+            self._gesture_memo.clear()
+        self._gesture_memo[memo_key] = sign
+        return sign  # None when no gesture was recognized
     
     def _respond_to_sign(self, sign_key):
         """Respond to detected sign language input"""
-        if sign_key == "THUMBS_UP":
-            response = "Great! I'm glad you agree."
-        elif sign_key == "THUMBS_DOWN":
-            response = "I understand you disagree or need something different."
-        elif sign_key == "OPEN_PALM":
-            response = "Hello! How can I help you?"
-        elif sign_key == "CLOSED_FIST":
-            response = "I'll wait for your next instruction."
-        elif sign_key == "PEACE_SIGN":
-            response = "Peace! Do you need help with two options?"
-        elif sign_key == "POINTING_UP":
-            response = "Do you have a question? I'm listening."
-        elif sign_key == "PINCH":
-            response = "I understand you're referring to something small or precise."
-        else:
-            response = "I see you're using sign language. How can I help?"
+        response = _SIGN_REPLY_TABLE.get(
+            sign_key, "I see you're using sign language. How can I help?")
         
         # Add bot response
-        self.messages.append({
-            "id": len(self.messages) + 1,
-            "text": response,
-            "sender": "bot",
-            "timestamp": self._get_timestamp(),
-            "sign_key": sign_key
-        })
-        
+        message = self._add_message(response, "bot", sign_key=sign_key)
+
         # Update display
-        self._display_messages()
+        self._append_message(message)
         
         # Speak the response if audio is enabled
         if self.is_audio_enabled and TTS_AVAILABLE:
             self._speak_text(response)
     
-    def _update_video_canvas(self, imgtk):
-        """Update the video canvas with a new frame"""
-        self.video_canvas.imgtk = imgtk  # Keep a reference to prevent garbage collection
-        self.video_canvas.config(width=imgtk.width(), height=imgtk.height())
-        self.video_canvas.create_image(0, 0, anchor=tk.NW, image=imgtk)
+    def _drain_ui(self):
+        """Apply all pending worker-thread UI updates in one pass.
+
+        Runs on the Tk thread every ~16 ms while the camera is on, so the
+        main loop sees one callback per tick no matter how many events
+        the pipeline produced in the meantime.
+        """
+        with self._ui_lock:
+            state, self._ui_state = self._ui_state, {}
+
+        sign = state.get("sign")
+        if sign is not None:
+            self._update_sign_detection(sign)
+
+        for msg in state.get("new_msgs", ()):
+            self._append_message(msg)
+
+        self._update_video_canvas()
+
+        if self.camera_running:
+            self.root.after(16, self._drain_ui)
+
+    def _update_video_canvas(self):
+        """Paste the latest camera frame into the reusable PhotoImage"""
+        try:
+            frame = self._frame_queue.get_nowait()
+        except queue.Empty:
+            return  # Frame already consumed by an earlier callback
+
+        height, width = frame.shape[:2]
+        # frombuffer with the raw RGB decoder and zero stride padding wraps
+        # the ring buffer's memory directly -- no HxWx3 copy is made on the
+        # Python side; the only remaining copy is PhotoImage's paste into Tk
+        img = Image.frombuffer("RGB", (width, height), frame, "raw", "RGB", 0, 1)
+
+        if (self._video_photo is None or
+            (self._video_photo.width(), self._video_photo.height()) != (width, height)):
+            # First frame (or resolution change): allocate the PhotoImage
+            # once and bind it to a single reused canvas item
+            self._video_photo = ImageTk.PhotoImage(image=img)
+            self.video_canvas.config(width=width, height=height)
+            if self._canvas_img_id is None:
+                self._canvas_img_id = self.video_canvas.create_image(
+                    0, 0, anchor=tk.NW, image=self._video_photo)
+            else:
+                self.video_canvas.itemconfig(self._canvas_img_id, image=self._video_photo)
+        else:
+            # Steady state: reuse the existing PhotoImage buffer
+            self._video_photo.paste(img)
     
     def _update_sign_detection(self, sign):
         """Update the UI with detected sign information"""
-        if sign in self.sign_dict:
-            self.current_sign_label.config(text=f"Detected Sign: {self.sign_dict[sign]}")
-        else:
-            self.current_sign_label.config(text="Detected Sign: Unknown")
-        
-        self.detection_label.config(text="Detection: Active")
+        text = f"Detected Sign: {self.sign_dict.get(sign, 'Unknown')}"
+
+        # .config forces a widget redraw, so only touch the labels when
+        # the detected sign actually changed
+        if text != self._last_sign_label_text:
+            self._last_sign_label_text = text
+            self.current_sign_label.config(text=text)
+            self.detection_label.config(text="Detection: Active")
     
     def _toggle_sign_language(self):
         """Toggle sign language detection mode"""
@@ -757,8 +1135,10 @@ class SignLanguageChatbot:
             self.sign_button.config(text="👋 Sign Mode")
             self.detection_label.config(text="Detection: Inactive")
             self.current_sign_label.config(text="Detected Sign: None")
+            self._last_sign_label_text = None  # force the next update through
         else:
             # Turn on sign language detection
+            self._ensure_hands()
             self.is_sign_language_mode = True
             self.sign_button.config(text="👋 Sign Mode ✓")
             self.detection_label.config(text="Detection: Active")
@@ -829,10 +1209,20 @@ class SignLanguageChatbot:
     
     def _show_sign_guide(self):
         """Show a guide for supported sign language gestures"""
+        # The guide content is static: build the window with all its sign
+        # drawings once, then just re-show it instead of recreating every
+        # widget and re-issuing every canvas primitive per open
+        if self._guide_window is not None and self._guide_window.winfo_exists():
+            self._guide_window.deiconify()
+            self._guide_window.lift()
+            return
+
         guide_window = tk.Toplevel(self.root)
         guide_window.title("Sign Language Guide")
         guide_window.geometry("500x400")
         guide_window.transient(self.root)
+        guide_window.protocol("WM_DELETE_WINDOW", guide_window.withdraw)
+        self._guide_window = guide_window
         
         # Create guide UI
         ttk.Label(guide_window, text="Supported Sign Language Gestures", 
@@ -857,8 +1247,8 @@ class SignLanguageChatbot:
             ttk.Label(description_frame, text=sign_meaning, font=("Arial", 12, "bold")).pack(anchor=tk.W)
             ttk.Label(description_frame, text=self._get_sign_description(sign_key)).pack(anchor=tk.W)
         
-        # Close button
-        ttk.Button(guide_window, text="Close", command=guide_window.destroy).pack(pady=10)
+        # Close button (hide, don't destroy — the window is reused)
+        ttk.Button(guide_window, text="Close", command=guide_window.withdraw).pack(pady=10)
     
     def _draw_simple_sign(self, canvas, sign_key):
         """Draw a simple representation of the sign on the given canvas"""
@@ -890,35 +1280,55 @@ class SignLanguageChatbot:
     
     def _get_sign_description(self, sign_key):
         """Get a description of how to perform the sign"""
-        descriptions = {
-            "THUMBS_UP": "Extend thumb upward with other fingers closed to show approval or agreement.",
-            "THUMBS_DOWN": "Extend thumb downward with other fingers closed to show disapproval or disagreement.",
-            "OPEN_PALM": "Extend all fingers with palm facing forward to say hello or indicate stop.",
-            "CLOSED_FIST": "Close all fingers to form a fist to indicate wait or hold.",
-            "PEACE_SIGN": "Extend index and middle fingers while keeping other fingers closed to indicate peace or the number two.",
-            "POINTING_UP": "Extend only the index finger upward to indicate attention or to ask a question.",
-            "PINCH": "Touch the tips of thumb and index finger to indicate something small or precise."
-        }
-        
-        return descriptions.get(sign_key, "No description available")
+        return _SIGN_DESCRIPTIONS.get(sign_key, "No description available")
         
     def _show_message(self, message):
         """Show a message in a simple dialog"""
-        messagebox = tk.Toplevel(self.root)
-        messagebox.title("Message")
-        messagebox.geometry("300x150")
-        messagebox.transient(self.root)
-        messagebox.grab_set()
-        
-        ttk.Label(messagebox, text=message, wraplength=280).pack(expand=True, fill=tk.BOTH, padx=20, pady=20)
-        ttk.Button(messagebox, text="OK", command=messagebox.destroy).pack(pady=10)
-        
-        # Auto-close after 3 seconds
-        messagebox.after(3000, messagebox.destroy)
+        # One dialog is built lazily and reused: showing a message swaps
+        # the StringVar text and deiconifies, instead of constructing a
+        # fresh Toplevel (and a window-manager round-trip) every time
+        if self._msg_dialog is None or not self._msg_dialog.winfo_exists():
+            self._msg_dialog = tk.Toplevel(self.root)
+            self._msg_dialog.title("Message")
+            self._msg_dialog.geometry("300x150")
+            self._msg_dialog.transient(self.root)
+            self._msg_dialog.protocol("WM_DELETE_WINDOW", self._hide_message)
+
+            self._msg_text = tk.StringVar()
+            ttk.Label(self._msg_dialog, textvariable=self._msg_text,
+                    wraplength=280).pack(expand=True, fill=tk.BOTH, padx=20, pady=20)
+            ttk.Button(self._msg_dialog, text="OK", command=self._hide_message).pack(pady=10)
+
+        self._msg_text.set(message)
+        self._msg_dialog.deiconify()
+        self._msg_dialog.lift()
+        self._msg_dialog.grab_set()
+
+        # Auto-close after 3 seconds; cancel any close still pending from
+        # a previous message so it can't hide this one early
+        if self._msg_close_id is not None:
+            self._msg_dialog.after_cancel(self._msg_close_id)
+        self._msg_close_id = self._msg_dialog.after(3000, self._hide_message)
+
+    def _hide_message(self):
+        """Hide the reusable message dialog"""
+        if self._msg_close_id is not None:
+            self._msg_dialog.after_cancel(self._msg_close_id)
+            self._msg_close_id = None
+
+        if self._msg_dialog is not None and self._msg_dialog.winfo_exists():
+            self._msg_dialog.grab_release()
+            self._msg_dialog.withdraw()
     
     def _get_timestamp(self):
         """Get current timestamp in HH:MM format"""
-        return datetime.now().strftime("%H:%M")
+        # strftime (with its locale lookups) only needs to run when the
+        # minute actually changes
+        minute = int(time.time() // 60)
+        if minute != self._ts_minute:
+            self._ts_minute = minute
+            self._ts_str = datetime.now().strftime("%H:%M")
+        return self._ts_str
     
     def run(self):
         """Run the main application loop"""
@@ -926,21 +1336,42 @@ class SignLanguageChatbot:
         
     def cleanup(self):
         """Clean up resources"""
-        if self.camera_running:
-            self.camera_running = False
-        
-        if self.video_capture:
-            self.video_capture.release()
-        
-        if TTS_AVAILABLE:
-            self.tts_engine.stop()
+        self.camera_running = False
+        self._stop_event.set()
+
+        # Join the pipeline workers before releasing anything, so the
+        # capture device and MediaPipe graph are not torn down while a
+        # thread is still using them
+        for worker in self._workers:
+            worker.join(timeout=1.0)
+        self._workers = []
+
+        # Release each resource even if an earlier teardown step raises
+        try:
+            if self.video_capture:
+                self.video_capture.release()
+                self.video_capture = None
+        finally:
+            try:
+                if self.hands is not None:
+                    self.hands.close()
+                    self.hands = None
+            finally:
+                if self.tts_engine is not None:
+                    self.tts_engine.stop()
+                    self.tts_engine = None
+
+    def _on_close(self):
+        """Handle the window-manager close request"""
+        self.cleanup()
+        self.root.destroy()
 
 # Main execution
 if __name__ == "__main__":
     root = tk.Tk()
     app = SignLanguageChatbot(root)
-    
+
     # Ensure proper cleanup on exit
-    root.protocol("WM_DELETE_WINDOW", lambda: (app.cleanup(), root.destroy()))
-    
+    root.protocol("WM_DELETE_WINDOW", app._on_close)
+
     app.run()
\ No newline at end of file